@@ -1,11 +1,13 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from typing import Union
 
-app = FastAPI(title="Aurora API")
+import numpy as np
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, StrictInt, confloat, field_validator
 
-@app.get("/health")
-def health():
-    return {"ok": True}
+app = FastAPI(title="Aurora API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,14 +17,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.get("/analyze_day")
-def analyze_day():
+@app.get("/health")
+def health():
+    return {"ok": True}
+
+def _analyze_day():
     # Dummy demand pattern for now (24 hours)
     demand = [30, 28, 27, 26, 25, 25, 28, 35, 45, 55, 60, 62,
               65, 70, 75, 80, 85, 88, 80, 70, 60, 50, 40, 35]
 
-    peak_value = max(demand)
-    peak_hour = demand.index(peak_value)
+    peak_hour = int(np.argmax(demand))
+    peak_value = demand[peak_hour]
 
     recommendation = f"Peak demand occurs at hour {peak_hour} with {peak_value} kW. Shift flexible loads away from this hour."
 
@@ -34,18 +39,35 @@ def analyze_day():
         "explanation": "This is a basic forecast. Aurora will get smarter as you feed it real data."
     }
 
-from pydantic import BaseModel
+# The demo endpoints only depend on hardcoded inputs, so serialise them once
+_ANALYZE_DAY_RESPONSE = orjson.dumps(_analyze_day())
+
+@app.get("/analyze_day")
+def analyze_day():
+    return Response(_ANALYZE_DAY_RESPONSE, media_type="application/json")
 
 class BuildingData(BaseModel):
-    hourly_usage: list   # list of 24 numbers
+    hourly_usage: list[Union[StrictInt, confloat(strict=True, allow_inf_nan=False)]]   # list of 24 numbers
     max_capacity_kw: float
 
+    @field_validator("hourly_usage", mode="before")
+    @classmethod
+    def _check_int_range(cls, usage):
+        # analyze_building finds the peak in float64, which is only exact for
+        # |ints| <= 2**53 (this also keeps them within orjson's 64-bit range).
+        # Check before the float branch of the union turns larger ones into floats
+        if isinstance(usage, list) and any(
+            type(v) is int and not -2**53 <= v <= 2**53 for v in usage
+        ):
+            raise ValueError("hourly_usage integers must be within ±2**53")
+        return usage
+
 @app.post("/analyze_building")
 def analyze_building(data: BuildingData):
     usage = data.hourly_usage
 
-    peak_value = max(usage)
-    peak_hour = usage.index(peak_value)
+    peak_hour = int(np.asarray(usage, dtype=np.float64).argmax())
+    peak_value = usage[peak_hour]
 
     recommendation = (
         f"Peak usage is at hour {peak_hour} with {peak_value} kW. "
@@ -60,13 +82,15 @@ def analyze_building(data: BuildingData):
     }
 
 
-@app.get("/simulate_demo_building")
-def simulate_demo_building():
-    """
-    Demo: simulate one day for a typical office building,
-    then show how Aurora would optimise it.
-    """
+# Simple hourly tariff in £/kWh
+_TARIFF = np.array(
+    [0.08] * 6      # 0–5   cheap night
+    + [0.15] * 10   # 6–15  normal
+    + [0.30] * 5    # 16–20 expensive peak
+    + [0.12] * 3    # 21–23 late evening
+)
 
+def _simulate_demo_building():
     # 24 hours, simple baseline demand in kW
     hours = list(range(24))
     baseline_demand = [
@@ -77,21 +101,8 @@ def simulate_demo_building():
         70, 60, 50, 40            # 20–23 late evening
     ]
 
-    # Simple tariff in £/kWh
-    def price_per_kwh(hour: int) -> float:
-        if hour < 6:
-            return 0.08   # cheap night
-        elif hour < 16:
-            return 0.15   # normal
-        elif hour < 21:
-            return 0.30   # expensive peak
-        else:
-            return 0.12   # late evening
-
     # Cost with no optimisation
-    baseline_cost = 0.0
-    for h, demand in enumerate(baseline_demand):
-        baseline_cost += demand * price_per_kwh(h)
+    baseline_cost = float(_TARIFF @ np.asarray(baseline_demand))
 
     # Copy demand for optimisation
     optimised_demand = baseline_demand.copy()
@@ -108,9 +119,7 @@ def simulate_demo_building():
         optimised_demand[night_h] += shift_amount
 
     # Cost after optimisation
-    optimised_cost = 0.0
-    for h, demand in enumerate(optimised_demand):
-        optimised_cost += demand * price_per_kwh(h)
+    optimised_cost = float(_TARIFF @ np.asarray(optimised_demand))
 
     cost_saving = round(baseline_cost - optimised_cost, 2)
     peak_before = max(baseline_demand)
@@ -132,3 +141,12 @@ def simulate_demo_building():
         "co2_saving_kg": co2_saving_kg,
     }
 
+_DEMO_BUILDING_RESPONSE = orjson.dumps(_simulate_demo_building())
+
+@app.get("/simulate_demo_building")
+def simulate_demo_building():
+    """
+    Demo: simulate one day for a typical office building,
+    then show how Aurora would optimise it.
+    """
+    return Response(_DEMO_BUILDING_RESPONSE, media_type="application/json")